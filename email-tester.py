@@ -1,18 +1,490 @@
+import os
 import re
+import json
+import random
+import socket
+import sqlite3
+import sys
+import time
+import asyncio
+import logging
+import functools
+import threading
+import dns.rdata
+import dns.rdataclass
+import dns.rdatatype
 import dns.resolver
-import smtplib
-from typing import Tuple, Dict
+import dns.asyncresolver
+from collections import defaultdict, deque, Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Tuple, Dict, List, Optional
 from email.utils import parseaddr
 
+try:
+    import hyperscan
+except ImportError:  # optional: batch syntax checks fall back to re
+    hyperscan = None
+
+try:
+    import numpy as np
+except ImportError:  # optional: validate_syntax_batch_np falls back to Python
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# Number of recent samples per stage kept for timing_report percentiles
+TIMING_WINDOW = 10000
+
+# Record types that can route mail for a domain, in RFC 5321 preference order
+MAIL_HOST_RRTYPES = ('MX', 'A', 'AAAA')
+# Threads shared by all concurrent MX/A/AAAA lookups of one validator
+DNS_LOOKUP_WORKERS = 16
+
+# Per-MX-host SMTP limits: concurrent connections and new connections/second
+SMTP_MAX_CONNECTIONS_PER_HOST = 4
+SMTP_CONNECTS_PER_SECOND = 10
+# Transient replies (service unavailable / greylisting) retried with backoff
+SMTP_RETRY_CODES = frozenset({421, 450, 451})
+SMTP_MAX_RETRIES = 3
+# Addresses whose MAIL/RCPT/RSET are written before reading replies (RFC 2920)
+SMTP_PIPELINE_BATCH = 50
+
+# On-disk cache verdicts: which record type routes mail for the domain
+_VERDICT_NONE = 0
+_VERDICT_NXDOMAIN = 1
+_VERDICTS = {'MX': 2, 'A': 3, 'AAAA': 4}
+_VERDICT_RRTYPES = {code: rrtype for rrtype, code in _VERDICTS.items()}
+
+# Local caching resolver (unbound/dnsmasq) first, public resolver as fallback
+DEFAULT_NAMESERVERS = ['127.0.0.1', '1.1.1.1']
+
+# Bounds (seconds) applied to record TTLs when caching DNS answers
+MIN_CACHE_TTL = 60
+MAX_CACHE_TTL = 3600
+# NXDOMAIN / NoAnswer results are cached for a shorter, fixed period
+NEGATIVE_CACHE_TTL = 30
+
+# RFC 5322 compliant email regex (simplified version), compiled once
+_EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+# The pattern is ASCII-only, so skip Unicode-aware matching
+_EMAIL_RE = re.compile(_EMAIL_PATTERN, re.ASCII)
+
+
+def _load_domain_list(filename: str) -> frozenset:
+    """Load a one-domain-per-line list shipped next to this script."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+    try:
+        with open(path, encoding='utf-8') as f:
+            return frozenset(
+                line.strip().lower() for line in f
+                if line.strip() and not line.lstrip().startswith('#')
+            )
+    except FileNotFoundError:
+        return frozenset()
+
+
+# Domains that are accepted / rejected without any DNS lookups
+_KNOWN_GOOD_DOMAINS = _load_domain_list('known_good_domains.txt')
+_DISPOSABLE_DOMAINS = _load_domain_list('disposable_domains.txt')
+
+# Syntax check result codes, indexes into SYNTAX_MESSAGES
+SYNTAX_OK = 0
+SYNTAX_EMPTY = 1
+SYNTAX_FORMAT = 2
+SYNTAX_LOCAL_TOO_LONG = 3
+SYNTAX_DOMAIN_TOO_LONG = 4
+SYNTAX_CONSECUTIVE_DOTS = 5
+SYNTAX_DOT_BOUNDARY = 6
+
+SYNTAX_MESSAGES = tuple(sys.intern(message) for message in (
+    "Syntax is valid",
+    "Email must be a non-empty string",
+    "Invalid email format",
+    "Local part (before @) is too long (max 64 chars)",
+    "Domain part is too long (max 255 chars)",
+    "Email contains consecutive dots",
+    "Local part cannot start or end with a dot",
+))
+
+# Fixed check messages, interned so every result shares one string object
+_MSG_DOMAIN_EXISTS = sys.intern("Domain exists")
+_MSG_DOMAIN_EXISTS_IPV6 = sys.intern("Domain exists (IPv6)")
+_MSG_NO_ADDRESS_RECORDS = sys.intern("Domain has no A or AAAA records")
+_MSG_NXDOMAIN = sys.intern("Domain does not exist")
+_MSG_NO_NAMESERVERS = sys.intern("No nameservers found for domain")
+_MSG_DNS_TIMEOUT = sys.intern("DNS query timed out")
+_MSG_NO_MX_FOUND = sys.intern("No MX records found")
+_MSG_NO_MX = sys.intern("No MX records for domain")
+_MSG_WHITELISTED = sys.intern("Domain is whitelisted")
+_MSG_KNOWN_PROVIDER = sys.intern("Known mail provider")
+_MSG_DISPOSABLE = sys.intern("Disposable email domain")
+_MSG_SMTP_DISCONNECTED = sys.intern("SMTP server disconnected")
+
+
+class Err(IntEnum):
+    """Why a check failed; turned into text by format_error when displayed."""
+    SYNTAX = 1             # detail: SYNTAX_* code
+    DOMAIN_NXDOMAIN = 2
+    DOMAIN_NO_NS = 3
+    DNS_TIMEOUT = 4
+    DNS_OTHER = 5          # detail: exception
+    DOMAIN_NO_ADDRESS = 6
+    DOMAIN_DISPOSABLE = 7
+    MX_NONE = 8
+    SMTP_DISCONNECT = 9
+    SMTP_REJECTED = 10     # detail: (RCPT reply code, reply bytes)
+    SMTP_ERROR = 11        # detail: (SMTP code, error bytes)
+    SMTP_UNAVAILABLE = 12  # detail: exception
+
+
+_ERROR_MESSAGES = {
+    Err.DOMAIN_NXDOMAIN: _MSG_NXDOMAIN,
+    Err.DOMAIN_NO_NS: _MSG_NO_NAMESERVERS,
+    Err.DNS_TIMEOUT: _MSG_DNS_TIMEOUT,
+    Err.DOMAIN_NO_ADDRESS: _MSG_NO_ADDRESS_RECORDS,
+    Err.DOMAIN_DISPOSABLE: _MSG_DISPOSABLE,
+    Err.MX_NONE: _MSG_NO_MX,
+    Err.SMTP_DISCONNECT: _MSG_SMTP_DISCONNECTED,
+}
+
+
+def format_error(error: Err, detail: object = None) -> str:
+    """Build the human-readable message for a failed check."""
+    if error == Err.SYNTAX:
+        return SYNTAX_MESSAGES[detail]
+    if error == Err.DNS_OTHER:
+        return f"DNS error: {str(detail)}"
+    if error == Err.SMTP_REJECTED:
+        code, message = detail
+        return f"SMTP verification failed (code {code}): {message.decode()}"
+    if error == Err.SMTP_ERROR:
+        code, message = detail
+        return f"SMTP error ({code}): {message.decode()}"
+    if error == Err.SMTP_UNAVAILABLE:
+        return f"SMTP verification unavailable: {str(detail)}"
+    return _ERROR_MESSAGES[error]
+
+
+def _build_hyperscan_db():
+    """Compile the email pattern into a Hyperscan database, if available."""
+    if hyperscan is None:
+        return None
+    db = hyperscan.Database()
+    # MULTILINE lets ^/$ anchor on each line of a newline-joined batch
+    db.compile(expressions=[_EMAIL_PATTERN.encode()], ids=[0], elements=1,
+               flags=[hyperscan.HS_FLAG_MULTILINE])
+    return db
+
+
+_HS_DB = _build_hyperscan_db()
+
+
+def _timed(stage: str):
+    """
+    Decorator recording the wall time of an EmailValidator method under
+    `stage` (see EmailValidator.timing_report) when the validator was created
+    with record_timings=True. Works for sync and async methods.
+    """
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(self, *args, **kwargs):
+                if not self.record_timings:
+                    return await func(self, *args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return await func(self, *args, **kwargs)
+                finally:
+                    self._record_timing(stage, time.perf_counter() - start)
+        else:
+            @functools.wraps(func)
+            def wrapper(self, *args, **kwargs):
+                if not self.record_timings:
+                    return func(self, *args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(self, *args, **kwargs)
+                finally:
+                    self._record_timing(stage, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def _discard_task_result(task: asyncio.Task):
+    """Done callback marking a background task's exception as retrieved."""
+    if not task.cancelled():
+        task.exception()
+
+
+class _RateLimiter:
+    """
+    Thread-safe token bucket allowing `rate` acquisitions per second, shared
+    by threads and event loops alike.
+    """
+    
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _take(self) -> float:
+        """Take a token and return 0, or return how long until one is due."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate,
+                               self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / self.rate
+    
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            wait = self._take()
+            if not wait:
+                return
+            time.sleep(wait)
+    
+    async def acquire_async(self):
+        """Like acquire, but sleeps on the event loop instead of blocking."""
+        while True:
+            wait = self._take()
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+
+async def _acquire_async(semaphore: threading.Semaphore):
+    """Take a threading semaphore from a coroutine without blocking the loop."""
+    while not semaphore.acquire(blocking=False):
+        await asyncio.sleep(0.01)
+
+
+@dataclass(slots=True, frozen=True)
+class _NegativeAnswer:
+    """
+    Cached NXDOMAIN/NoAnswer. Only the exception type and arguments are
+    kept, so each cache hit raises a fresh instance instead of re-raising
+    (and growing the traceback of) one shared exception.
+    """
+    error_type: type
+    kwargs: dict
+    
+    def error(self) -> Exception:
+        return self.error_type(**self.kwargs)
+
+
+@dataclass(slots=True)
+class CheckResult:
+    """
+    Outcome of a single validation check. Failed checks carry an Err code
+    and its raw detail instead of a preformatted message; use describe()
+    for display text.
+    """
+    valid: bool
+    message: str = ''
+    error: Optional[Err] = None
+    detail: object = None
+    
+    def describe(self) -> str:
+        """Message for display, formatting the error only when needed."""
+        if self.error is not None:
+            return format_error(self.error, self.detail)
+        return self.message
+
+
+@dataclass(slots=True)
+class EmailResult:
+    """Validation results for one email; checks that did not run are None."""
+    email: str
+    is_valid: bool = True
+    syntax: Optional[CheckResult] = None
+    domain: Optional[CheckResult] = None
+    mx: Optional[CheckResult] = None
+    smtp: Optional[CheckResult] = None
+
+
+# EmailResult check fields in pipeline order, with their display labels
+CHECK_LABELS = (
+    ('syntax', 'SYNTAX'),
+    ('domain', 'DOMAIN'),
+    ('mx', 'MX_RECORDS'),
+    ('smtp', 'SMTP'),
+)
+
+
 class EmailValidator:
     """Validate email addresses without sending emails."""
     
-    def __init__(self):
-        # RFC 5322 compliant email regex (simplified version)
-        self.email_regex = re.compile(
-            r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        )
+    def __init__(self, nameservers: Optional[List[str]] = None,
+                 cache_path: Optional[str] = None,
+                 record_timings: bool = False):
+        """
+        Args:
+            nameservers: DNS servers to query (defaults to DEFAULT_NAMESERVERS)
+            cache_path: SQLite file persisting mail-host lookups across runs;
+                None keeps the cache in memory only
+            record_timings: Whether to time the validation stages for
+                timing_report (off by default to keep calls cheap)
+        """
+        self.email_regex = _EMAIL_RE
+        if nameservers is None:
+            nameservers = DEFAULT_NAMESERVERS
+        # Dedicated stub resolvers (sync and async share one configuration)
+        self._resolver = self._configure_resolver(
+            dns.resolver.Resolver(configure=False), nameservers)
+        self._aresolver = self._configure_resolver(
+            dns.asyncresolver.Resolver(configure=False), nameservers)
+        self._dns_executor = ThreadPoolExecutor(max_workers=DNS_LOOKUP_WORKERS,
+                                                thread_name_prefix='dns')
+        # MX host -> (connection semaphore, connection rate limiter)
+        self._mx_limits: Dict[str, Tuple[threading.Semaphore, _RateLimiter]] = {}
+        self._mx_limits_lock = threading.Lock()
+        # (domain, rrtype) -> (answer or _NegativeAnswer, expiry)
+        self._dns_cache: Dict[Tuple[str, str], Tuple[object, float]] = {}
+        self._dns_cache_lock = threading.Lock()
+        self._db = None
+        self._db_lock = threading.Lock()
+        if cache_path is not None:
+            self._db = sqlite3.connect(cache_path, isolation_level=None,
+                                       check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS mail_hosts ("
+                "domain TEXT PRIMARY KEY, mx BLOB, a BLOB, aaaa BLOB, "
+                "expires REAL, verdict INT)"
+            )
+        self.record_timings = record_timings
+        # stage -> recent durations (seconds) and a power-of-two µs histogram
+        self._stats: Dict[str, deque] = defaultdict(lambda: deque(maxlen=TIMING_WINDOW))
+        self._histogram: Dict[str, Counter] = defaultdict(Counter)
+    
+    def close(self):
+        """Close the on-disk cache and stop the DNS lookup threads."""
+        with self._db_lock:
+            if self._db is not None:
+                # Closing the last connection checkpoints and removes -wal/-shm
+                self._db.close()
+                self._db = None
+        self._dns_executor.shutdown(wait=False)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def _record_timing(self, stage: str, elapsed: float):
+        """Store one duration for a stage and log it at DEBUG level."""
+        self._stats[stage].append(elapsed)
+        # Bucket by upper bound: 1 µs, 2 µs, 4 µs, ... so sub-ms stages spread out
+        self._histogram[stage][1 << int(elapsed * 1_000_000).bit_length()] += 1
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s took %.3f ms", stage, elapsed * 1000)
+    
+    def timing_report(self) -> Dict[str, Dict]:
+        """
+        Summarize how long each validation stage has taken. Empty unless
+        the validator was created with record_timings=True.
+        
+        Returns:
+            Dictionary mapping stage name to 'count', 'p50_ms', 'p95_ms'
+            (over the last TIMING_WINDOW calls) and 'histogram_us'
+            (call counts over all calls, keyed by power-of-two upper
+            bound in microseconds). validate_email times 'syntax',
+            'deliverability' (the domain and MX checks share one DNS pass)
+            and 'smtp'
+        """
+        report = {}
+        for stage, samples in self._stats.items():
+            ordered = sorted(samples)
+            last = len(ordered) - 1
+            report[stage] = {
+                'count': sum(self._histogram[stage].values()),
+                'p50_ms': ordered[round(last * 0.50)] * 1000,
+                'p95_ms': ordered[round(last * 0.95)] * 1000,
+                'histogram_us': dict(sorted(self._histogram[stage].items())),
+            }
+        return report
+    
+    @staticmethod
+    def _configure_resolver(resolver, nameservers: List[str]):
+        """
+        Point a resolver at the given nameservers with short timeouts, no
+        search-list expansion and EDNS enabled.
+        """
+        resolver.nameservers = list(nameservers)
+        resolver.timeout = 2
+        resolver.lifetime = 4
+        resolver.use_search_by_default = False
+        resolver.use_edns(0, 0, 4096)
+        return resolver
+    
+    def _cache_get(self, domain: str, rrtype: str):
+        """Return the cached answer (or _NegativeAnswer), or None on a miss."""
+        key = (domain.lower(), rrtype)
+        with self._dns_cache_lock:
+            entry = self._dns_cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() < entry[1]:
+                return entry[0]
+            del self._dns_cache[key]
+        return None
+    
+    def _cache_put(self, domain: str, rrtype: str, value: object, ttl: float):
+        """Store an answer or _NegativeAnswer for ttl seconds."""
+        with self._dns_cache_lock:
+            self._dns_cache[(domain.lower(), rrtype)] = (value, time.monotonic() + ttl)
+    
+    @staticmethod
+    def _answer_ttl(answer) -> float:
+        """Clamp the TTL of an answer to the configured cache bounds."""
+        return min(max(answer.rrset.ttl, MIN_CACHE_TTL), MAX_CACHE_TTL)
+    
+    def _cached_resolve(self, domain: str, rrtype: str):
+        """
+        Resolve a record, serving repeated queries from the TTL cache.
+        NXDOMAIN and NoAnswer are cached and re-raised on later hits.
+        """
+        cached = self._cache_get(domain, rrtype)
+        if isinstance(cached, _NegativeAnswer):
+            raise cached.error()
+        if cached is not None:
+            return cached
+        
+        try:
+            answer = self._resolver.resolve(domain, rrtype)
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+            self._cache_put(domain, rrtype, _NegativeAnswer(type(e), e.kwargs),
+                            NEGATIVE_CACHE_TTL)
+            raise
+        self._cache_put(domain, rrtype, answer, self._answer_ttl(answer))
+        return answer
+    
+    async def _cached_resolve_async(self, domain: str, rrtype: str):
+        """Async variant of _cached_resolve sharing the same cache."""
+        cached = self._cache_get(domain, rrtype)
+        if isinstance(cached, _NegativeAnswer):
+            raise cached.error()
+        if cached is not None:
+            return cached
+        
+        try:
+            answer = await self._aresolver.resolve(domain, rrtype)
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+            self._cache_put(domain, rrtype, _NegativeAnswer(type(e), e.kwargs),
+                            NEGATIVE_CACHE_TTL)
+            raise
+        self._cache_put(domain, rrtype, answer, self._answer_ttl(answer))
+        return answer
     
+    @_timed('syntax')
     def validate_syntax(self, email: str) -> Tuple[bool, str]:
         """
         Validate email syntax using regex.
@@ -20,34 +492,176 @@ class EmailValidator:
         Returns:
             Tuple of (is_valid, message)
         """
+        code = self._syntax_code(email)
+        return code == SYNTAX_OK, SYNTAX_MESSAGES[code]
+    
+    def _syntax_code(self, email: str) -> int:
+        """Return SYNTAX_OK or the SYNTAX_* code of the first failed check."""
         if not email or not isinstance(email, str):
-            return False, "Email must be a non-empty string"
+            return SYNTAX_EMPTY
         
         email = email.strip()
         
+        # Cheap rejection before running the regex: need a non-empty local part
+        # and domain around the '@'. str.find/`in` scan in C (memchr and
+        # CPython's fastsearch), which already compare a word at a time, so
+        # the byte scans here are left to them rather than Python loops.
+        at = email.find('@')
+        if at < 1 or at == len(email) - 1:
+            return SYNTAX_FORMAT
+        
         # Basic format check
         if not self.email_regex.match(email):
-            return False, "Invalid email format"
+            return SYNTAX_FORMAT
         
-        # Check for valid characters
-        local_part, domain = email.rsplit('@', 1)
-        
-        if len(local_part) > 64:
-            return False, "Local part (before @) is too long (max 64 chars)"
+        return self._parts_code(email, at)
+    
+    @staticmethod
+    def _parts_code(email: str, at: int) -> int:
+        """Structural checks for an email that already matched the regex."""
+        # The regex guarantees a single '@' at index `at`, so the part lengths
+        # and boundary characters are read directly instead of slicing
+        if at > 64:
+            return SYNTAX_LOCAL_TOO_LONG
         
-        if len(domain) > 255:
-            return False, "Domain part is too long (max 255 chars)"
+        if len(email) - at - 1 > 255:
+            return SYNTAX_DOMAIN_TOO_LONG
         
         # Check for consecutive dots
         if '..' in email:
-            return False, "Email contains consecutive dots"
+            return SYNTAX_CONSECUTIVE_DOTS
         
         # Check if local part starts or ends with dot
-        if local_part.startswith('.') or local_part.endswith('.'):
-            return False, "Local part cannot start or end with a dot"
+        if email[0] == '.' or email[at - 1] == '.':
+            return SYNTAX_DOT_BOUNDARY
+        
+        return SYNTAX_OK
+    
+    def validate_syntax_codes(self, emails: List[str]) -> List[int]:
+        """
+        Validate the syntax of many emails without building messages.
+        
+        Returns:
+            List of SYNTAX_* codes, one per input email; SYNTAX_MESSAGES
+            maps each code to its message
+        """
+        syntax_code = self._syntax_code
+        return [syntax_code(email) for email in emails]
+    
+    def validate_syntax_batch(self, emails: List[str]) -> List[bool]:
+        """
+        Validate the syntax of many emails at once.
+        
+        With hyperscan installed the regex runs as a single scan over the
+        newline-joined batch; otherwise each email goes through validate_syntax.
+        
+        Returns:
+            List of booleans, one per input email
+        """
+        if _HS_DB is None:
+            return [code == SYNTAX_OK for code in self.validate_syntax_codes(emails)]
         
-        return True, "Syntax is valid"
+        # Embedded newlines would split an entry across lines, so blank them
+        stripped = [e.strip() if isinstance(e, str) else '' for e in emails]
+        stripped = ['' if '\n' in e else e for e in stripped]
+        
+        # Map the end offset of each line in the joined buffer to its index.
+        # Non-ASCII characters become '?', which the pattern never accepts.
+        ends = {}
+        offset = 0
+        for i, email in enumerate(stripped):
+            offset += len(email)
+            ends[offset] = i
+            offset += 1
+        buffer = '\n'.join(stripped).encode('ascii', 'replace')
+        
+        matched = [False] * len(stripped)
+        
+        def on_match(pattern_id, start, end, flags, context):
+            i = ends.get(end)
+            if i is not None:
+                matched[i] = True
+        
+        _HS_DB.scan(buffer, match_event_handler=on_match)
+        
+        return [
+            matched[i] and self._parts_code(email, email.find('@')) == SYNTAX_OK
+            for i, email in enumerate(stripped)
+        ]
+    
+    def validate_syntax_batch_np(self, emails: List[str]) -> List[bool]:
+        """
+        Validate the syntax of many emails, pre-filtering with NumPy.
+        
+        The '@' position, part lengths and consecutive-dot test are computed
+        for the whole batch in vectorized passes; only emails that survive
+        this filter go through the regex and remaining checks. Without NumPy
+        this is the same as validate_syntax_batch.
+        
+        Packing the batch into an array costs a Python-level pass per email,
+        so this is only faster than validate_syntax_batch when most of the
+        input fails the prefilter (e.g. noisy scraped lists); on mostly
+        well-formed input it is slower.
+        
+        Returns:
+            List of booleans, one per input email
+        """
+        if np is None or not emails:
+            return self.validate_syntax_batch(emails)
+        
+        # 64 (local) + 1 (@) + 255 (domain) is the longest acceptable email.
+        # Non-ASCII characters become '?', which the pattern never accepts.
+        # The byte-string width is left to NumPy (the longest entry, at most
+        # 320) since the vectorized passes scale with it.
+        stripped = [e.strip() if isinstance(e, str) else '' for e in emails]
+        too_long = np.fromiter((len(e) > 320 for e in stripped), dtype=bool,
+                               count=len(stripped))
+        arr = np.array([e[:320].encode('ascii', 'replace') for e in stripped])
+        
+        at_idx = np.char.rfind(arr, b'@')
+        dom_len = np.char.str_len(arr) - at_idx - 1
+        dot_dot = np.char.find(arr, b'..') != -1
+        ok = ((at_idx > 0) & (at_idx <= 64) & (dom_len > 0) & (dom_len <= 255)
+              & ~dot_dot & ~too_long)
+        
+        results = [False] * len(stripped)
+        regex = self.email_regex
+        for i in np.flatnonzero(ok).tolist():
+            email = stripped[i]
+            if regex.match(email):
+                results[i] = self._parts_code(email, int(at_idx[i])) == SYNTAX_OK
+        return results
+    
+    @staticmethod
+    def _top_mx_hosts(mx_records, count: int = 3) -> List[str]:
+        """Names of the `count` most preferred MX hosts (lowest preference first)."""
+        ordered = sorted(mx_records, key=lambda r: r.preference)
+        return [r.exchange.to_text() for r in ordered[:count]]
+    
+    def _mx_summary(self, mx_records, verbose: bool = True) -> str:
+        """Message listing the preferred MX hosts, or '' when not verbose."""
+        if not verbose:
+            return ''
+        return f"MX records found: {', '.join(self._top_mx_hosts(mx_records))}"
+    
+    @staticmethod
+    def _primary_mx_host(mx_records) -> str:
+        """Lowercased name of the most preferred MX host."""
+        return min(mx_records, key=lambda r: r.preference).exchange.to_text().lower()
     
+    def _smtp_host(self, domain: str, rrtype: Optional[str], answer) -> str:
+        """
+        Host to probe over SMTP for a _resolve_mail_hosts result: the primary
+        MX, or the domain itself when it only has A/AAAA records (RFC 5321
+        implicit MX).
+        """
+        if rrtype == 'MX':
+            return self._primary_mx_host(answer)
+        if rrtype is None:
+            raise dns.resolver.NoAnswer()
+        return domain.lower()
+    
+    @_timed('domain')
     def validate_domain(self, email: str) -> Tuple[bool, str]:
         """
         Check if the domain exists (DNS A or AAAA record).
@@ -60,28 +674,30 @@ class EmailValidator:
             
             # Try to resolve the domain
             try:
-                dns.resolver.resolve(domain, 'A')
-                return True, "Domain exists"
+                self._cached_resolve(domain, 'A')
+                return True, _MSG_DOMAIN_EXISTS
             except dns.resolver.NoAnswer:
                 # Try AAAA (IPv6) if A record doesn't exist
                 try:
-                    dns.resolver.resolve(domain, 'AAAA')
-                    return True, "Domain exists (IPv6)"
-                except:
-                    return False, "Domain has no A or AAAA records"
+                    self._cached_resolve(domain, 'AAAA')
+                    return True, _MSG_DOMAIN_EXISTS_IPV6
+                except Exception:
+                    return False, _MSG_NO_ADDRESS_RECORDS
                     
         except dns.resolver.NXDOMAIN:
-            return False, "Domain does not exist"
+            return False, _MSG_NXDOMAIN
         except dns.resolver.NoNameservers:
-            return False, "No nameservers found for domain"
+            return False, _MSG_NO_NAMESERVERS
         except dns.resolver.Timeout:
-            return False, "DNS query timed out"
+            return False, _MSG_DNS_TIMEOUT
         except Exception as e:
             return False, f"DNS error: {str(e)}"
     
-    def validate_mx_records(self, email: str) -> Tuple[bool, str]:
+    @_timed('mx')
+    def validate_mx_records(self, email: str, verbose: bool = True) -> Tuple[bool, str]:
         """
         Check if the domain has MX (Mail Exchange) records.
+        With verbose=False the MX host summary is not built.
         
         Returns:
             Tuple of (is_valid, message)
@@ -90,21 +706,204 @@ class EmailValidator:
             domain = email.rsplit('@', 1)[1]
             
             # Get MX records
-            mx_records = dns.resolver.resolve(domain, 'MX')
-            mx_list = [str(r.exchange) for r in mx_records]
+            mx_records = self._cached_resolve(domain, 'MX')
             
-            if mx_list:
-                return True, f"MX records found: {', '.join(mx_list[:3])}"
+            if len(mx_records):
+                return True, self._mx_summary(mx_records, verbose)
             else:
-                return False, "No MX records found"
+                return False, _MSG_NO_MX_FOUND
                 
         except dns.resolver.NoAnswer:
-            return False, "No MX records for domain"
+            return False, _MSG_NO_MX
         except dns.resolver.NXDOMAIN:
-            return False, "Domain does not exist"
+            return False, _MSG_NXDOMAIN
         except Exception as e:
             return False, f"MX lookup error: {str(e)}"
     
+    def _disk_cache_get(self, domain: str):
+        """
+        Look up a still-valid mail-host row in the on-disk cache.
+        
+        Returns:
+            (rrtype, records) as from _resolve_mail_hosts, or None on a miss.
+            Raises NXDOMAIN if the domain was cached as nonexistent.
+        """
+        if self._db is None:
+            return None
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT mx, a, aaaa, verdict FROM mail_hosts "
+                "WHERE domain = ? AND expires > ?",
+                (domain.lower(), time.time()),
+            ).fetchone()
+        if row is None:
+            return None
+        
+        mx, a, aaaa, verdict = row
+        if verdict == _VERDICT_NXDOMAIN:
+            raise dns.resolver.NXDOMAIN()
+        if verdict == _VERDICT_NONE:
+            return None, None
+        rrtype = _VERDICT_RRTYPES[verdict]
+        if rrtype == 'MX':
+            texts = [f"{preference} {exchange}" for preference, exchange in json.loads(mx)]
+        else:
+            texts = json.loads(a if rrtype == 'A' else aaaa)
+        rdtype = dns.rdatatype.from_text(rrtype)
+        return rrtype, [dns.rdata.from_text(dns.rdataclass.IN, rdtype, text)
+                        for text in texts]
+    
+    def _disk_cache_put(self, domain: str, verdict: int, answer=None):
+        """Store the outcome of a mail-host resolution in the on-disk cache."""
+        if self._db is None:
+            return
+        mx = a = aaaa = None
+        if answer is None:
+            ttl = NEGATIVE_CACHE_TTL
+        else:
+            ttl = self._answer_ttl(answer)
+            rrtype = _VERDICT_RRTYPES[verdict]
+            if rrtype == 'MX':
+                mx = json.dumps([(r.preference, r.exchange.to_text()) for r in answer])
+            elif rrtype == 'A':
+                a = json.dumps([r.to_text() for r in answer])
+            else:
+                aaaa = json.dumps([r.to_text() for r in answer])
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO mail_hosts "
+                "(domain, mx, a, aaaa, expires, verdict) VALUES (?, ?, ?, ?, ?, ?)",
+                (domain.lower(), mx, a, aaaa, time.time() + ttl, verdict),
+            )
+    
+    def purge_expired(self) -> int:
+        """
+        Delete expired rows from the on-disk cache.
+        
+        Returns:
+            Number of rows removed
+        """
+        if self._db is None:
+            return 0
+        with self._db_lock:
+            cursor = self._db.execute("DELETE FROM mail_hosts WHERE expires <= ?",
+                                      (time.time(),))
+        return cursor.rowcount
+    
+    def _resolve_mail_hosts(self, domain: str):
+        """
+        Resolve where mail for a domain is routed (RFC 5321): MX first,
+        falling back to A and then AAAA when the domain has no MX records.
+        Results are persisted in the on-disk cache when one is configured.
+        
+        Returns:
+            Tuple of (rrtype, answer), or (None, None) if the domain exists
+            but has none of these records
+        """
+        stored = self._disk_cache_get(domain)
+        if stored is not None:
+            return stored
+        try:
+            rrtype, answer = self._lookup_mail_hosts(domain)
+        except dns.resolver.NXDOMAIN:
+            self._disk_cache_put(domain, _VERDICT_NXDOMAIN)
+            raise
+        self._disk_cache_put(domain, _VERDICTS.get(rrtype, _VERDICT_NONE), answer)
+        return rrtype, answer
+    
+    def _lookup_mail_hosts(self, domain: str):
+        """
+        DNS part of _resolve_mail_hosts. For a domain whose MX answer is not
+        in the in-memory cache, all three lookups are started concurrently so
+        a fallback costs no extra round trip; the answers are still consumed
+        in MX, A, AAAA order.
+        """
+        futures = None
+        if self._cache_get(domain, 'MX') is None:
+            futures = {
+                rrtype: self._dns_executor.submit(self._cached_resolve, domain, rrtype)
+                for rrtype in MAIL_HOST_RRTYPES
+            }
+        
+        for rrtype in MAIL_HOST_RRTYPES:
+            try:
+                if futures is not None:
+                    answer = futures[rrtype].result()
+                else:
+                    answer = self._cached_resolve(domain, rrtype)
+                return rrtype, answer
+            except dns.resolver.NoAnswer:
+                continue
+        return None, None
+    
+    def _deliverability_checks(self, rrtype, answer,
+                               verbose: bool = True) -> Dict[str, CheckResult]:
+        """Turn the result of _resolve_mail_hosts into domain/MX check results."""
+        if rrtype == 'MX':
+            return {
+                'domain': CheckResult(True, _MSG_DOMAIN_EXISTS if verbose else ''),
+                'mx': CheckResult(True, self._mx_summary(answer, verbose)),
+            }
+        if rrtype == 'A':
+            domain_check = CheckResult(True, _MSG_DOMAIN_EXISTS if verbose else '')
+        elif rrtype == 'AAAA':
+            domain_check = CheckResult(True, _MSG_DOMAIN_EXISTS_IPV6 if verbose else '')
+        else:
+            return {'domain': CheckResult(False, error=Err.DOMAIN_NO_ADDRESS)}
+        return {
+            'domain': domain_check,
+            'mx': CheckResult(False, error=Err.MX_NONE),
+        }
+    
+    @staticmethod
+    def _dns_error(error: Exception) -> CheckResult:
+        """Failed domain check for a DNS exception."""
+        if isinstance(error, dns.resolver.NXDOMAIN):
+            return CheckResult(False, error=Err.DOMAIN_NXDOMAIN)
+        if isinstance(error, dns.resolver.NoNameservers):
+            return CheckResult(False, error=Err.DOMAIN_NO_NS)
+        if isinstance(error, dns.resolver.Timeout):
+            return CheckResult(False, error=Err.DNS_TIMEOUT)
+        return CheckResult(False, error=Err.DNS_OTHER, detail=error)
+    
+    @staticmethod
+    def _listed_domain_checks(domain: str,
+                              verbose: bool = True) -> Optional[Dict[str, CheckResult]]:
+        """Results for whitelisted or disposable domains, or None to use DNS."""
+        domain = domain.lower()
+        if domain in _KNOWN_GOOD_DOMAINS:
+            return {
+                'domain': CheckResult(True, _MSG_WHITELISTED if verbose else ''),
+                'mx': CheckResult(True, _MSG_KNOWN_PROVIDER if verbose else ''),
+            }
+        if domain in _DISPOSABLE_DOMAINS:
+            return {'domain': CheckResult(False, error=Err.DOMAIN_DISPOSABLE)}
+        return None
+    
+    @_timed('deliverability')
+    def validate_deliverability(self, email: str,
+                                verbose: bool = True) -> Dict[str, CheckResult]:
+        """
+        Check that the domain exists and has MX records using a single
+        MX -> A -> AAAA resolution pass. Whitelisted and disposable domains
+        are decided without any DNS lookups. With verbose=False, messages
+        of passed checks are left empty.
+        
+        Returns:
+            Dictionary with 'domain' and, if the domain exists, 'mx' entries
+            (the matching EmailResult fields), each a CheckResult
+        """
+        domain = email.rsplit('@', 1)[1]
+        listed = self._listed_domain_checks(domain, verbose)
+        if listed is not None:
+            return listed
+        
+        try:
+            rrtype, answer = self._resolve_mail_hosts(domain)
+        except Exception as e:
+            return {'domain': self._dns_error(e)}
+        return self._deliverability_checks(rrtype, answer, verbose)
+    
     def validate_smtp(self, email: str, timeout: int = 10) -> Tuple[bool, str]:
         """
         Verify email existence by connecting to SMTP server (without sending).
@@ -113,119 +912,643 @@ class EmailValidator:
         Returns:
             Tuple of (is_valid, message)
         """
+        check = self._check_smtp(email, timeout=timeout)
+        return check.valid, check.describe()
+    
+    @_timed('smtp')
+    def _check_smtp(self, email: str, verbose: bool = True, timeout: int = 10) -> CheckResult:
+        """SMTP check as a CheckResult; see validate_smtp."""
         try:
             domain = email.rsplit('@', 1)[1]
             
-            # Get MX records
-            mx_records = dns.resolver.resolve(domain, 'MX')
-            mx_host = str(mx_records[0].exchange)
-            
-            # Connect to SMTP server
-            server = smtplib.SMTP(timeout=timeout)
-            server.connect(mx_host)
-            server.helo(server.local_hostname)
-            server.mail('test@example.com')  # Sender (can be anything)
-            code, message = server.rcpt(email)  # Recipient to verify
-            server.quit()
+            mx_host = self._smtp_host(domain, *self._resolve_mail_hosts(domain))
+        except Exception as e:
+            return CheckResult(False, error=Err.SMTP_UNAVAILABLE, detail=e)
+        
+        return self._smtp_rcpt(mx_host, email, timeout, verbose)
+    
+    def _smtp_rcpt(self, mx_host: str, email: str, timeout: int,
+                   verbose: bool = True) -> CheckResult:
+        """Run a single EHLO/MAIL/RCPT conversation against an MX host."""
+        return self._smtp_session(mx_host, [email], timeout, verbose)[email]
+    
+    @staticmethod
+    def _rcpt_result(code: int, message: bytes, verbose: bool = True) -> CheckResult:
+        """Interpret the server reply to RCPT TO (message left empty if not verbose)."""
+        # 250 = success, 251 = user not local (but will forward)
+        if code == 250 or code == 251:
+            return CheckResult(True, f"SMTP verification passed (code {code})" if verbose else '')
+        else:
+            return CheckResult(False, error=Err.SMTP_REJECTED, detail=(code, message))
+    
+    def _host_limits(self, mx_host: str) -> Tuple[threading.Semaphore, _RateLimiter]:
+        """Connection semaphore and rate limiter shared by all sessions to a host."""
+        key = mx_host.lower()
+        with self._mx_limits_lock:
+            limits = self._mx_limits.get(key)
+            if limits is None:
+                limits = (threading.Semaphore(SMTP_MAX_CONNECTIONS_PER_HOST),
+                          _RateLimiter(SMTP_CONNECTS_PER_SECOND))
+                self._mx_limits[key] = limits
+            return limits
+    
+    def _smtp_session(self, mx_host: str, recipients: List[str], timeout: int,
+                      verbose: bool = True) -> Dict[str, CheckResult]:
+        """
+        Blocking wrapper around _smtp_session_async for the sync API; runs
+        it on a private event loop (in a helper thread if this thread is
+        already running one).
+        
+        Returns:
+            Dictionary mapping each recipient to its CheckResult
+        """
+        def run() -> Dict[str, CheckResult]:
+            return asyncio.run(self._smtp_session_async(mx_host, recipients, timeout,
+                                                        verbose))
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return run()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(run).result()
+    
+    def group_by_mx(self, emails: List[str]) -> Tuple[Dict[str, List[str]],
+                                                      Dict[str, CheckResult]]:
+        """
+        Group emails by the MX host that would receive them.
+        
+        Returns:
+            Tuple of (emails_by_mx, failures) where failures maps emails whose
+            MX lookup failed to a failed CheckResult
+        """
+        emails_by_mx: Dict[str, List[str]] = {}
+        failures: Dict[str, CheckResult] = {}
+        
+        for email in emails:
+            try:
+                domain = email.rsplit('@', 1)[1]
+                mx_host = self._smtp_host(domain, *self._resolve_mail_hosts(domain))
+            except Exception as e:
+                failures[email] = CheckResult(False, error=Err.SMTP_UNAVAILABLE, detail=e)
+                continue
+            emails_by_mx.setdefault(mx_host, []).append(email)
+        
+        return emails_by_mx, failures
+    
+    @_timed('smtp_batch')
+    def validate_smtp_batch(self, emails_by_mx: Dict[str, List[str]],
+                            timeout: int = 10,
+                            max_workers: int = 32,
+                            verbose: bool = True) -> Dict[str, CheckResult]:
+        """
+        Verify many emails via SMTP, opening one connection per MX host.
+        Distinct MX hosts are probed concurrently; each host only ever sees
+        a single connection.
+        
+        Args:
+            emails_by_mx: Mapping of MX host to the emails it receives
+                (see group_by_mx)
+            timeout: Socket timeout in seconds
+            max_workers: Maximum number of MX hosts probed at the same time
+            verbose: Whether to fill in messages of passed checks
+        
+        Returns:
+            Dictionary mapping each email to its CheckResult
+        """
+        results = {}
+        if not emails_by_mx:
+            return results
+        
+        workers = min(max_workers, len(emails_by_mx))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._smtp_session, mx_host, recipients, timeout, verbose)
+                for mx_host, recipients in emails_by_mx.items()
+            ]
+            for future in as_completed(futures):
+                results.update(future.result())
+        return results
+    
+    async def _resolve_mail_hosts_async(self, domain: str):
+        """Async variant of _resolve_mail_hosts."""
+        stored = self._disk_cache_get(domain)
+        if stored is not None:
+            return stored
+        try:
+            rrtype, answer = await self._lookup_mail_hosts_async(domain)
+        except dns.resolver.NXDOMAIN:
+            self._disk_cache_put(domain, _VERDICT_NXDOMAIN)
+            raise
+        self._disk_cache_put(domain, _VERDICTS.get(rrtype, _VERDICT_NONE), answer)
+        return rrtype, answer
+    
+    async def _lookup_mail_hosts_async(self, domain: str):
+        """Async variant of _lookup_mail_hosts."""
+        tasks = None
+        if self._cache_get(domain, 'MX') is None:
+            tasks = {}
+            for rrtype in MAIL_HOST_RRTYPES:
+                task = asyncio.ensure_future(self._cached_resolve_async(domain, rrtype))
+                # Lookups left running after an early return still fill the
+                # cache; retrieve their errors so asyncio doesn't warn
+                task.add_done_callback(_discard_task_result)
+                tasks[rrtype] = task
+        
+        for rrtype in MAIL_HOST_RRTYPES:
+            try:
+                if tasks is not None:
+                    answer = await tasks[rrtype]
+                else:
+                    answer = await self._cached_resolve_async(domain, rrtype)
+                return rrtype, answer
+            except dns.resolver.NoAnswer:
+                continue
+        return None, None
+    
+    @_timed('deliverability')
+    async def validate_deliverability_async(self, email: str,
+                                            verbose: bool = True) -> Dict[str, CheckResult]:
+        """Async variant of validate_deliverability."""
+        domain = email.rsplit('@', 1)[1]
+        listed = self._listed_domain_checks(domain, verbose)
+        if listed is not None:
+            return listed
+        
+        try:
+            rrtype, answer = await self._resolve_mail_hosts_async(domain)
+        except Exception as e:
+            return {'domain': self._dns_error(e)}
+        return self._deliverability_checks(rrtype, answer, verbose)
+    
+    async def validate_smtp_async(self, email: str, timeout: int = 10) -> Tuple[bool, str]:
+        """
+        Async variant of validate_smtp. The MX lookup is awaited and the
+        SMTP conversation is spoken directly over an asyncio stream (see
+        probe_rcpt), so no worker thread is tied up per check.
+        
+        Returns:
+            Tuple of (is_valid, message)
+        """
+        check = await self._check_smtp_async(email, timeout=timeout)
+        return check.valid, check.describe()
+    
+    @_timed('smtp')
+    async def _check_smtp_async(self, email: str, verbose: bool = True,
+                                timeout: int = 10) -> CheckResult:
+        """Async variant of _check_smtp."""
+        try:
+            domain = email.rsplit('@', 1)[1]
             
-            # 250 = success, 251 = user not local (but will forward)
-            if code == 250 or code == 251:
-                return True, f"SMTP verification passed (code {code})"
-            else:
-                return False, f"SMTP verification failed (code {code}): {message.decode()}"
-                
-        except smtplib.SMTPServerDisconnected:
-            return False, "SMTP server disconnected"
-        except smtplib.SMTPResponseException as e:
-            return False, f"SMTP error ({e.smtp_code}): {e.smtp_error.decode()}"
+            mail_hosts = await self._resolve_mail_hosts_async(domain)
+            mx_host = self._smtp_host(domain, *mail_hosts)
         except Exception as e:
-            return False, f"SMTP verification unavailable: {str(e)}"
+            return CheckResult(False, error=Err.SMTP_UNAVAILABLE, detail=e)
+        
+        return (await self._smtp_session_async(mx_host, [email], timeout, verbose))[email]
+    
+    @staticmethod
+    def _is_transient(check: CheckResult) -> bool:
+        """Whether a failed SMTP check carries a retryable reply code."""
+        return (check.error in (Err.SMTP_REJECTED, Err.SMTP_ERROR)
+                and check.detail[0] in SMTP_RETRY_CODES)
+    
+    async def _smtp_session_async(self, mx_host: str, recipients: List[str],
+                                  timeout: int,
+                                  verbose: bool = True) -> Dict[str, CheckResult]:
+        """
+        Probe several recipients of one MX host with probe_rcpt, over one
+        connection where the server allows it.
+        
+        Sessions to the same host, sync or async, share a limit of
+        SMTP_MAX_CONNECTIONS_PER_HOST at a time and SMTP_CONNECTS_PER_SECOND
+        new connections. Recipients that got a transient reply
+        (SMTP_RETRY_CODES) are retried together on one new connection after
+        the session ends and a jittered exponential backoff, up to
+        SMTP_MAX_RETRIES times.
+        
+        Returns:
+            Dictionary mapping each recipient to its CheckResult
+        """
+        semaphore, limiter = self._host_limits(mx_host)
+        results = {}
+        pending = recipients
+        
+        for attempt in range(SMTP_MAX_RETRIES + 1):
+            await _acquire_async(semaphore)
+            try:
+                checks = await probe_rcpt(mx_host, pending, timeout, limiter=limiter,
+                                          verbose=verbose)
+            finally:
+                semaphore.release()
+            results.update(checks)
+            pending = [addr for addr, check in checks.items() if self._is_transient(check)]
+            if not pending or attempt == SMTP_MAX_RETRIES:
+                break
+            # Back off without holding the host's connection slot
+            await asyncio.sleep(random.uniform(0.5, 1.5) * 2 ** attempt)
+        return results
     
-    def validate_email(self, email: str, check_smtp: bool = False) -> Dict:
+    @_timed('smtp_batch')
+    async def validate_smtp_batch_async(self, emails_by_mx: Dict[str, List[str]],
+                                        timeout: int = 10,
+                                        verbose: bool = True) -> Dict[str, CheckResult]:
+        """
+        Async variant of validate_smtp_batch: one pipelined connection per
+        MX host, all hosts probed concurrently on the event loop.
+        
+        Returns:
+            Dictionary mapping each email to its CheckResult
+        """
+        results = {}
+        sessions = await asyncio.gather(*(
+            self._smtp_session_async(mx_host, recipients, timeout, verbose)
+            for mx_host, recipients in emails_by_mx.items()
+        ))
+        for checks in sessions:
+            results.update(checks)
+        return results
+    
+    def validate_email(self, email: str, check_smtp: bool = False,
+                       verbose: bool = True) -> EmailResult:
         """
         Perform comprehensive email validation.
         
         Args:
             email: Email address to validate
             check_smtp: Whether to perform SMTP verification (may be blocked)
+            verbose: Whether to fill in messages of passed checks (empty
+                strings if False); failures are always described by their Err
         
         Returns:
-            Dictionary with validation results
+            EmailResult with validation results
         """
-        results = {
-            'email': email,
-            'is_valid': True,
-            'checks': {}
-        }
+        result = EmailResult(email)
         
         # 1. Syntax validation
-        is_valid, message = self.validate_syntax(email)
-        results['checks']['syntax'] = {'valid': is_valid, 'message': message}
-        if not is_valid:
-            results['is_valid'] = False
-            return results
+        result.syntax = self._check_syntax(email, verbose)
+        if not result.syntax.valid:
+            result.is_valid = False
+            return result
         
-        # 2. Domain validation
-        is_valid, message = self.validate_domain(email)
-        results['checks']['domain'] = {'valid': is_valid, 'message': message}
-        if not is_valid:
-            results['is_valid'] = False
-            return results
+        # 2-3. Domain and MX records validation (one DNS resolution pass)
+        checks = self.validate_deliverability(email, verbose)
+        if not self._apply_deliverability(result, checks):
+            return result
         
-        # 3. MX records validation
-        is_valid, message = self.validate_mx_records(email)
-        results['checks']['mx_records'] = {'valid': is_valid, 'message': message}
-        if not is_valid:
-            results['is_valid'] = False
-            return results
+        # 4. SMTP validation (optional, often blocked)
+        if check_smtp:
+            result.smtp = self._check_smtp(email, verbose)
+            if not result.smtp.valid:
+                result.is_valid = False
+        
+        return result
+    
+    @_timed('syntax')
+    def _check_syntax(self, email: str, verbose: bool = True) -> CheckResult:
+        """Syntax check as a CheckResult (failures carry Err.SYNTAX and the code)."""
+        code = self._syntax_code(email)
+        if code == SYNTAX_OK:
+            return CheckResult(True, SYNTAX_MESSAGES[code] if verbose else '')
+        return CheckResult(False, error=Err.SYNTAX, detail=code)
+    
+    @staticmethod
+    def _apply_deliverability(result: EmailResult,
+                              checks: Dict[str, CheckResult]) -> bool:
+        """
+        Record validate_deliverability output on a result.
+        
+        Returns:
+            False if one of the checks failed (result is marked invalid)
+        """
+        for field, check in checks.items():
+            setattr(result, field, check)
+            if not check.valid:
+                result.is_valid = False
+                return False
+        return True
+    
+    def validate_many(self, emails: List[str], check_smtp: bool = False,
+                      verbose: bool = True) -> List[EmailResult]:
+        """
+        Validate a list of emails, doing DNS work once per domain.
+        
+        Identical addresses are validated once and share a result. Addresses
+        that pass the syntax check are grouped by domain so the domain/MX
+        checks run once per domain, and SMTP checks (if requested) are
+        batched per MX host.
+        
+        Args:
+            emails: Email addresses to validate
+            check_smtp: Whether to perform SMTP verification (may be blocked)
+            verbose: Whether to fill in messages of passed checks (empty
+                strings if False); failures are always described by their Err
+        
+        Returns:
+            List of EmailResult (as from validate_email), in input order
+        """
+        results_by_email: Dict[str, EmailResult] = {}
+        by_domain = defaultdict(list)
+        
+        # 1. Syntax validation, once per distinct address
+        for email in emails:
+            if email in results_by_email:
+                continue
+            result = EmailResult(email)
+            results_by_email[email] = result
+            
+            result.syntax = self._check_syntax(email, verbose)
+            if not result.syntax.valid:
+                result.is_valid = False
+                continue
+            by_domain[email.rsplit('@', 1)[1].lower()].append(result)
+        
+        # 2-3. Domain and MX records validation, once per domain
+        smtp_candidates = []
+        for group in by_domain.values():
+            checks = self.validate_deliverability(group[0].email, verbose)
+            for result in group:
+                if self._apply_deliverability(result, checks):
+                    smtp_candidates.append(result.email)
+        
+        # 4. SMTP validation (optional, often blocked), one session per MX host
+        if check_smtp and smtp_candidates:
+            emails_by_mx, smtp_results = self.group_by_mx(smtp_candidates)
+            smtp_results.update(self.validate_smtp_batch(emails_by_mx, verbose=verbose))
+            for email, check in smtp_results.items():
+                result = results_by_email[email]
+                result.smtp = check
+                if not check.valid:
+                    result.is_valid = False
+        
+        return [results_by_email[email] for email in emails]
+    
+    async def validate_email_async(self, email: str, check_smtp: bool = False,
+                                   verbose: bool = True) -> EmailResult:
+        """
+        Async variant of validate_email; DNS lookups do not block the event loop.
+        
+        Args:
+            email: Email address to validate
+            check_smtp: Whether to perform SMTP verification (may be blocked)
+            verbose: Whether to fill in messages of passed checks (empty
+                strings if False); failures are always described by their Err
+        
+        Returns:
+            EmailResult with validation results
+        """
+        result = EmailResult(email)
+        
+        # 1. Syntax validation
+        result.syntax = self._check_syntax(email, verbose)
+        if not result.syntax.valid:
+            result.is_valid = False
+            return result
+        
+        # 2-3. Domain and MX records validation (one DNS resolution pass)
+        checks = await self.validate_deliverability_async(email, verbose)
+        if not self._apply_deliverability(result, checks):
+            return result
         
         # 4. SMTP validation (optional, often blocked)
         if check_smtp:
-            is_valid, message = self.validate_smtp(email)
-            results['checks']['smtp'] = {'valid': is_valid, 'message': message}
-            if not is_valid:
-                results['is_valid'] = False
+            result.smtp = await self._check_smtp_async(email, verbose)
+            if not result.smtp.valid:
+                result.is_valid = False
         
-        return results
+        return result
+
 
+class _ServerDisconnected(Exception):
+    """The SMTP server closed the connection mid-conversation."""
+
+
+@functools.lru_cache(maxsize=None)
+def _local_hostname() -> bytes:
+    """Name announced in EHLO/HELO."""
+    return socket.getfqdn().encode('ascii', 'ignore') or b'localhost'
+
+
+async def _read_reply(reader: asyncio.StreamReader) -> Tuple[int, bytes]:
+    """
+    Read one SMTP reply. Lines of a multiline reply look like `250-...`;
+    the last one has a space after the code (`250 ...`).
+    
+    Returns:
+        Tuple of (code, message) with the lines' text joined by newlines
+    """
+    lines = []
+    while True:
+        line = await reader.readline()
+        if not line.endswith(b'\n'):
+            raise _ServerDisconnected()
+        lines.append(line[4:].strip())
+        if line[3:4] != b'-':
+            return int(line[:3]), b'\n'.join(lines)
 
-def print_validation_results(results: Dict):
+
+def _probe_result(mail_reply: Tuple[int, bytes],
+                  rcpt_reply: Optional[Tuple[int, bytes]],
+                  verbose: bool) -> CheckResult:
+    """CheckResult for one address from its MAIL FROM and RCPT TO replies."""
+    if mail_reply[0] != 250:
+        return CheckResult(False, error=Err.SMTP_ERROR, detail=mail_reply)
+    return EmailValidator._rcpt_result(*rcpt_reply, verbose)
+
+
+def _closing(mail_reply: Tuple[int, bytes],
+             rcpt_reply: Optional[Tuple[int, bytes]]) -> bool:
+    """Whether the server answered 421, i.e. is closing the connection."""
+    return mail_reply[0] == 421 or (rcpt_reply is not None and rcpt_reply[0] == 421)
+
+
+async def _probe_connection(host: str, port: int, addrs: List[str], timeout: float,
+                            results: Dict[str, CheckResult], allow_pipelining: bool,
+                            limiter: Optional[_RateLimiter], verbose: bool):
+    """
+    One connection of probe_rcpt. Results are stored as replies arrive, so
+    after a disconnect `results` holds every address answered so far.
+    """
+    if limiter is not None:
+        await limiter.acquire_async()
+    reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    
+    async def reply() -> Tuple[int, bytes]:
+        return await asyncio.wait_for(_read_reply(reader), timeout)
+    
+    async def command(line: bytes) -> Tuple[int, bytes]:
+        writer.write(line + b'\r\n')
+        await writer.drain()
+        return await reply()
+    
+    try:
+        pipelining = False
+        code, message = await reply()
+        if code == 220:
+            code, message = await command(b'EHLO ' + _local_hostname())
+            if code == 250:
+                pipelining = (allow_pipelining
+                              and b'PIPELINING' in message.upper().split(b'\n'))
+            else:
+                code, message = await command(b'HELO ' + _local_hostname())
+        elif code == 250:
+            code = 0  # not a greeting
+        if code != 250:
+            error = CheckResult(False, error=Err.SMTP_ERROR, detail=(code, message))
+            results.update((addr, error) for addr in addrs)
+            return
+        
+        if pipelining:
+            for start in range(0, len(addrs), SMTP_PIPELINE_BATCH):
+                batch = addrs[start:start + SMTP_PIPELINE_BATCH]
+                for addr in batch:
+                    writer.write(b'MAIL FROM:<test@example.com>\r\nRCPT TO:<'
+                                 + addr.encode('ascii') + b'>\r\nRSET\r\n')
+                await writer.drain()
+                for i, addr in enumerate(batch):
+                    mail_reply = await reply()
+                    # After a 421 the server hangs up without further replies
+                    rcpt_reply = None if mail_reply[0] == 421 else await reply()
+                    results[addr] = _probe_result(mail_reply, rcpt_reply, verbose)
+                    if _closing(mail_reply, rcpt_reply):
+                        results.update((rest, results[addr]) for rest in addrs[start + i + 1:])
+                        return
+                    await reply()  # RSET
+        else:
+            # RFC 5321 lock-step: wait for each reply before the next command
+            for i, addr in enumerate(addrs):
+                mail_reply = await command(b'MAIL FROM:<test@example.com>')
+                rcpt_reply = None
+                if mail_reply[0] == 250:
+                    rcpt_reply = await command(b'RCPT TO:<' + addr.encode('ascii') + b'>')
+                results[addr] = _probe_result(mail_reply, rcpt_reply, verbose)
+                if _closing(mail_reply, rcpt_reply):
+                    results.update((rest, results[addr]) for rest in addrs[i + 1:])
+                    return
+                await command(b'RSET')
+        
+        writer.write(b'QUIT\r\n')
+        await writer.drain()
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass  # already reset by the server
+
+
+async def probe_rcpt(host: str, addrs: List[str], timeout: float = 10,
+                     port: int = 25,
+                     limiter: Optional[_RateLimiter] = None,
+                     verbose: bool = True) -> Dict[str, CheckResult]:
+    """
+    Probe recipients with RCPT TO over a raw asyncio connection; this is
+    the only SMTP client in the module. EHLO is sent once; when the server
+    advertises PIPELINING, the MAIL/RCPT/RSET of up to SMTP_PIPELINE_BATCH
+    addresses are written together and their replies read back in order,
+    otherwise each command waits for its reply. When the connection drops,
+    the unanswered addresses are retried one per round trip on a new
+    connection, reconnecting again as long as each connection makes
+    progress. A 421 (server shutting down) ends the session and is recorded
+    for the remaining addresses, for the caller to retry later. If a
+    limiter is given, every connection (reconnects included) first takes
+    one of its tokens. With verbose=False, passed checks get no message.
+    
+    Returns:
+        Dictionary mapping each address to its CheckResult
+    """
+    results: Dict[str, CheckResult] = {}
+    pending = []
+    for addr in addrs:
+        if not addr.isascii() or any(c in addr for c in '\r\n<>'):
+            results[addr] = CheckResult(False, error=Err.SMTP_UNAVAILABLE,
+                                        detail=ValueError(f"invalid address {addr!r}"))
+        else:
+            pending.append(addr)
+    
+    pipelining = True
+    retried = False
+    while pending:
+        answered = len(results)
+        try:
+            await _probe_connection(host, port, pending, timeout, results, pipelining,
+                                    limiter, verbose)
+        except (_ServerDisconnected, ConnectionResetError, BrokenPipeError):
+            remaining = [addr for addr in pending if addr not in results]
+            progressed = len(results) > answered
+            if remaining and (progressed or not retried):
+                # Servers hanging up after RSET lose the pipelined replies
+                pipelining = False
+                retried = not progressed
+                pending = remaining
+                continue
+            error = CheckResult(False, error=Err.SMTP_DISCONNECT)
+            results.update((addr, error) for addr in remaining)
+        except Exception as e:
+            if isinstance(e, asyncio.TimeoutError):
+                e = TimeoutError("timed out")
+            error = CheckResult(False, error=Err.SMTP_UNAVAILABLE, detail=e)
+            results.update((addr, error) for addr in pending if addr not in results)
+        break
+    return results
+
+
+async def parallel_validate(validator: EmailValidator, emails: List[str],
+                            check_smtp: bool = False,
+                            max_concurrency: int = 64,
+                            verbose: bool = True) -> List[EmailResult]:
+    """
+    Validate many emails concurrently, keeping at most max_concurrency
+    validations in flight. Results are returned in input order.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def _bounded(email: str) -> EmailResult:
+        async with semaphore:
+            return await validator.validate_email_async(email, check_smtp=check_smtp,
+                                                        verbose=verbose)
+    
+    return await asyncio.gather(*(_bounded(email) for email in emails))
+
+
+def print_validation_results(result: EmailResult):
     """Pretty print validation results."""
     print(f"\n{'='*60}")
-    print(f"Email: {results['email']}")
-    print(f"Overall Valid: {'✓ YES' if results['is_valid'] else '✗ NO'}")
+    print(f"Email: {result.email}")
+    print(f"Overall Valid: {'✓ YES' if result.is_valid else '✗ NO'}")
     print(f"{'='*60}")
     
-    for check_name, check_result in results['checks'].items():
-        status = '✓' if check_result['valid'] else '✗'
-        print(f"{status} {check_name.upper()}: {check_result['message']}")
+    for field, label in CHECK_LABELS:
+        check_result = getattr(result, field)
+        if check_result is None:
+            continue
+        status = '✓' if check_result.valid else '✗'
+        print(f"{status} {label}: {check_result.describe()}")
     print()
 
 
 # Example usage
 if __name__ == "__main__":
-    validator = EmailValidator()
-    
-    # Test emails
-    test_emails = [
-        "user@example.com",           # Valid format
-        "invalid.email@",             # Invalid syntax
-        "test@nonexistentdomain12345.com",  # Non-existent domain
-        "admin@gmail.com",            # Valid email
-        "user..name@domain.com",      # Double dots
-    ]
-    
-    print("EMAIL VALIDATION TESTS")
-    print("=" * 60)
-    
-    for email in test_emails:
-        # Validate without SMTP (faster, more reliable)
-        results = validator.validate_email(email, check_smtp=False)
-        print_validation_results(results)
-    
-    # Example with SMTP check (may fail on many domains)
-    print("\n" + "="*60)
-    print("SMTP VERIFICATION EXAMPLE (may be blocked by many servers)")
-    print("="*60)
-    results = validator.validate_email("admin@gmail.com", check_smtp=True)
-    print_validation_results(results)
\ No newline at end of file
+    with EmailValidator(cache_path='email_cache.db') as validator:
+        # Test emails
+        test_emails = [
+            "user@example.com",           # Valid format
+            "invalid.email@",             # Invalid syntax
+            "test@nonexistentdomain12345.com",  # Non-existent domain
+            "admin@gmail.com",            # Valid email
+            "user..name@domain.com",      # Double dots
+        ]
+        
+        print("EMAIL VALIDATION TESTS")
+        print("=" * 60)
+        
+        # Validate without SMTP (faster, more reliable), all emails concurrently
+        for result in asyncio.run(parallel_validate(validator, test_emails)):
+            print_validation_results(result)
+        
+        # Example with SMTP check (may fail on many domains)
+        print("\n" + "="*60)
+        print("SMTP VERIFICATION EXAMPLE (may be blocked by many servers)")
+        print("="*60)
+        results = validator.validate_email("admin@gmail.com", check_smtp=True)
+        print_validation_results(results)
\ No newline at end of file
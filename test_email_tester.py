@@ -0,0 +1,169 @@
+import asyncio
+import importlib.util
+import os
+import random
+import unittest
+
+# The script's name has a hyphen, so it can't be imported the usual way
+_spec = importlib.util.spec_from_file_location(
+    'email_tester', os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 'email-tester.py'))
+email_tester = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(email_tester)
+
+
+class FakeSMTPServer:
+    """
+    Minimal SMTP server accepting recipients whose local part starts with
+    "good". With enforce_sync (like Exim's smtp_enforce_sync), a client that
+    sends a command before reading the previous reply gets a 554 and is
+    disconnected. With quit_on_rset, the server hangs up after each RSET.
+    """
+
+    def __init__(self, pipelining: bool, enforce_sync: bool = False,
+                 quit_on_rset: bool = False):
+        self.pipelining = pipelining
+        self.enforce_sync = enforce_sync
+        self.quit_on_rset = quit_on_rset
+        self.sync_errors = 0
+        self.connections = 0
+        self._server = None
+
+    async def start(self) -> int:
+        self._server = await asyncio.start_server(self._handle, '127.0.0.1', 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _pending_input(self, reader: asyncio.StreamReader) -> bool:
+        try:
+            await asyncio.wait_for(reader.read(1), 0.05)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        writer.write(b'220 fake ESMTP\r\n')
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                command = line.strip().upper()
+                if (self.enforce_sync and not self.pipelining
+                        and await self._pending_input(reader)):
+                    self.sync_errors += 1
+                    writer.write(b'554 SMTP synchronization error\r\n')
+                    break
+                if command.startswith(b'EHLO'):
+                    extensions = b'250-PIPELINING\r\n' if self.pipelining else b''
+                    writer.write(b'250-fake\r\n' + extensions + b'250 8BITMIME\r\n')
+                elif command.startswith(b'RCPT'):
+                    if command.startswith(b'RCPT TO:<GOOD'):
+                        writer.write(b'250 ok\r\n')
+                    else:
+                        writer.write(b'550-no such\r\n550 user\r\n')
+                elif command == b'RSET' and self.quit_on_rset:
+                    writer.write(b'221 bye\r\n')
+                    break
+                elif command == b'QUIT':
+                    writer.write(b'221 bye\r\n')
+                    break
+                else:
+                    writer.write(b'250 ok\r\n')
+                await writer.drain()
+        finally:
+            await writer.drain()
+            writer.close()
+
+
+class ProbeRcptTest(unittest.IsolatedAsyncioTestCase):
+    addrs = ['good1@example.com', 'bad@example.com', 'good2@example.com']
+
+    async def _probe(self, server: FakeSMTPServer, limiter=None):
+        port = await server.start()
+        try:
+            return await email_tester.probe_rcpt('127.0.0.1', self.addrs,
+                                                 timeout=2, port=port,
+                                                 limiter=limiter)
+        finally:
+            await server.stop()
+
+    def _assert_verdicts(self, results):
+        self.assertEqual({addr: check.valid for addr, check in results.items()},
+                         {'good1@example.com': True, 'bad@example.com': False,
+                          'good2@example.com': True})
+        rejected = results['bad@example.com']
+        self.assertEqual(rejected.error, email_tester.Err.SMTP_REJECTED)
+        self.assertEqual(rejected.detail, (550, b'no such\nuser'))
+
+    async def test_without_pipelining_waits_for_each_reply(self):
+        server = FakeSMTPServer(pipelining=False, enforce_sync=True)
+        results = await self._probe(server)
+        self.assertEqual(server.sync_errors, 0)
+        self.assertEqual(server.connections, 1)
+        self._assert_verdicts(results)
+
+    async def test_pipelining(self):
+        server = FakeSMTPServer(pipelining=True)
+        results = await self._probe(server)
+        self.assertEqual(server.connections, 1)
+        self._assert_verdicts(results)
+
+    async def test_every_reconnect_takes_a_limiter_token(self):
+        class CountingLimiter(email_tester._RateLimiter):
+            acquired = 0
+
+            async def acquire_async(self):
+                CountingLimiter.acquired += 1
+                await super().acquire_async()
+
+        server = FakeSMTPServer(pipelining=True, quit_on_rset=True)
+        results = await self._probe(server, CountingLimiter(1000))
+        self._assert_verdicts(results)
+        self.assertGreater(server.connections, 1)
+        self.assertEqual(CountingLimiter.acquired, server.connections)
+
+
+def random_emails(count: int, seed: int = 0):
+    """Mix of well-formed addresses, mutations of them and random junk."""
+    rng = random.Random(seed)
+    alphabet = 'abcXYZ019._%+-@ é'
+    emails = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.4:
+            email = (''.join(rng.choices('abcxyz019._+-', k=rng.randint(1, 70)))
+                     + '@' + ''.join(rng.choices('abcxyz019-.', k=rng.randint(1, 30)))
+                     + '.' + ''.join(rng.choices('comrgxyz', k=rng.randint(1, 4))))
+        elif kind < 0.7:
+            email = 'user.name@mail.example.com'
+            for _ in range(rng.randint(1, 3)):
+                i = rng.randrange(len(email) + 1)
+                email = email[:i] + rng.choice(alphabet) + email[i:]
+        elif kind < 0.75:
+            email = 'a' * rng.randint(60, 70) + '@' + 'b' * rng.randint(240, 260) + '.com'
+        else:
+            email = ''.join(rng.choices(alphabet, k=rng.randint(0, 40)))
+        if rng.random() < 0.1:
+            email = ' ' + email + '\n'
+        emails.append(email)
+    return emails
+
+
+@unittest.skipIf(email_tester.np is None, "numpy is not installed")
+class SyntaxBatchNumpyTest(unittest.TestCase):
+
+    def test_matches_validate_syntax(self):
+        validator = email_tester.EmailValidator()
+        emails = random_emails(20000)
+        expected = [validator.validate_syntax(email)[0] for email in emails]
+        self.assertGreater(sum(expected), 1000)
+        self.assertEqual(validator.validate_syntax_batch_np(emails), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()